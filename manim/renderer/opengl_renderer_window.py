@@ -71,8 +71,7 @@ class Window(PygletWindow):
         self.renderer.scene.on_key_press(symbol, modifiers)
 
     def on_key_release(self, symbol, modifiers):
-        if symbol in self.renderer.pressed_keys:
-            self.renderer.pressed_keys.remove(symbol)
+        self.renderer.pressed_keys.discard(symbol)
         super().on_key_release(symbol, modifiers)
         self.renderer.scene.on_key_release(symbol, modifiers)
 
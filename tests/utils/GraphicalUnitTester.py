@@ -7,6 +7,21 @@ from manim import config, tempconfig
 from manim.renderer.opengl_renderer import OpenGLRenderer
 
 
+def _pixels_equal(frame_data, expected_frame_data):
+    """Return a mask of the pixels that are identical in both frames.
+    RGBA ``uint8`` frames are compared as one ``uint32`` per pixel, others per channel.
+    """
+    if all(
+        frame.dtype == np.uint8 and frame.shape[-1] == 4
+        for frame in (frame_data, expected_frame_data)
+    ):
+        return (
+            np.ascontiguousarray(frame_data).view(np.uint32)[..., 0]
+            == np.ascontiguousarray(expected_frame_data).view(np.uint32)[..., 0]
+        )
+    return np.all(frame_data == expected_frame_data, axis=-1)
+
+
 class GraphicalUnitTester:
     """Class used to test the animations.
 
@@ -44,6 +59,7 @@ class GraphicalUnitTester:
             tests_directory, "control_data", "graphical_units_data", module_tested
         )
         self.rgb_atol = rgb_atol
+        self._expected_frame_data = None
 
         # IMPORTANT NOTE : The graphical units tests don't use for now any
         # custom manim.cfg, since it is impossible to manually select a
@@ -54,12 +70,12 @@ class GraphicalUnitTester:
         config["disable_caching"] = True
         config["quality"] = "low_quality"
 
-        for dir_temp in [
+        for dir_temp in {
             self.path_tests_medias_cache,
             config["text_dir"],
             config["tex_dir"],
-        ]:
-            os.makedirs(dir_temp)
+        }:
+            os.makedirs(dir_temp, exist_ok=True)
 
         with tempconfig({"dry_run": True}):
             if config["renderer"] == "opengl":
@@ -70,16 +86,20 @@ class GraphicalUnitTester:
 
     def _load_data(self):
         """Load the np.array of the last frame of a pre-rendered scene. If not found, throw FileNotFoundError.
+        The frame is only read from disk once and cached for subsequent calls.
 
         Returns
         -------
         :class:`numpy.array`
             The pre-rendered frame.
         """
-        frame_data_path = os.path.join(
-            os.path.join(self.path_control_data, f"{self.scene}.npz")
-        )
-        return np.load(frame_data_path)["frame_data"]
+        if self._expected_frame_data is None:
+            frame_data_path = os.path.join(
+                os.path.join(self.path_control_data, f"{self.scene}.npz")
+            )
+            with np.load(frame_data_path) as data:
+                self._expected_frame_data = data["frame_data"]
+        return self._expected_frame_data
 
     def _show_diff_helper(self, frame_data, expected_frame_data):
         """Will visually display with matplotlib differences between frame generated and the one expected."""
@@ -99,17 +119,16 @@ class GraphicalUnitTester:
         ax.set_title("Expected :")
 
         ax = fig.add_subplot(gs[1, :])
-        diff_im = expected_frame_data.copy()
-        diff_im = np.where(
-            frame_data != np.array([0, 0, 0, 255]),
-            np.array([0, 255, 0, 255], dtype="uint8"),
-            np.array([0, 0, 0, 255], dtype="uint8"),
-        )  # Set any non-black pixels to green
-        np.putmask(
-            diff_im,
-            expected_frame_data != frame_data,
-            np.array([255, 0, 0, 255], dtype="uint8"),
-        )  # Set any different pixels to red
+        same = _pixels_equal(frame_data, expected_frame_data)
+        # Only the colour channels decide whether a pixel is black, so that
+        # transparent black stays black in the summary.
+        non_black = frame_data[..., :3].any(axis=-1)
+        diff_im = np.zeros_like(expected_frame_data)
+        diff_im[..., 3] = 255
+        # Set any non-black pixels to green
+        diff_im[non_black & same] = np.array([0, 255, 0, 255], dtype="uint8")
+        # Set any different pixels to red
+        diff_im[~same] = np.array([255, 0, 0, 255], dtype="uint8")
         ax.imshow(diff_im, interpolation="nearest")
         ax.set_title("Differences summary : (green = same, red = different)")
 
@@ -127,17 +146,27 @@ class GraphicalUnitTester:
             + f"\nframe_data.shape = {frame_data.shape}"
         )
 
-        mismatches = np.logical_not(
-            np.isclose(frame_data, expected_frame_data, atol=self.rgb_atol, rtol=0)
-        )
-        if mismatches.any():
-            incorrect_indices = np.argwhere(mismatches)
-            first_incorrect_index = incorrect_indices[0][:2]
+        # Most tests pass with identical frames, which needs no mismatch mask.
+        if np.array_equal(frame_data, expected_frame_data):
+            return
+
+        # With rtol=0, np.isclose reduces to |a - b| <= atol. Integer frames
+        # are widened to a signed type so the subtraction cannot wrap around.
+        dtype = np.result_type(frame_data, expected_frame_data)
+        if np.issubdtype(dtype, np.integer):
+            dtype = np.int64
+        diff = np.abs(frame_data.astype(dtype) - expected_frame_data.astype(dtype))
+        mismatches = (diff > self.rgb_atol).any(axis=-1)
+        has_mismatches = bool(mismatches.any())
+        if has_mismatches:
+            first_incorrect_index = np.array(
+                np.unravel_index(np.argmax(mismatches), mismatches.shape)
+            )
             first_incorrect_point = frame_data[tuple(first_incorrect_index)]
             expected_point = expected_frame_data[tuple(first_incorrect_index)]
             if show_diff:
                 self._show_diff_helper(frame_data, expected_frame_data)
-            assert not mismatches.any(), (
+            assert not has_mismatches, (
                 f"The frames don't match. {str(self.scene).replace('Test', '')} has been modified."
                 + "\nPlease ignore if it was intended."
                 + f"\nFirst unmatched index is at {first_incorrect_index}: {first_incorrect_point} != {expected_point}"